@@ -4,18 +4,27 @@ It includes all files found—even if they don't match any known Salesforce meta
 
 How it works:
 - Recursively scans all files in the specified directory (including subdirectories).
+- Skips directories that never hold Salesforce metadata (.git, .sfdx, node_modules, ...) unless --include-hidden is given.
 - Uses an extended SALESFORCE_METADATA_TYPES mapping to classify files by their extension.
 - For files that match a known extension, it removes the extension from the filename for clarity.
 - For files that do not match any known extension, the type is set to an empty string.
-- Uses Git (if available) to determine if a file is "Created", "Changed", or "Unmodified".
+- Uses a single Git status call (if available) to determine if a file is "Created", "Changed", or "Unmodified".
 - Compiles the collected information into a Markdown table with columns: State, Name, Type, and Path.
+- Optionally lists directories with a thread pool (--jobs N) for high-latency filesystems.
+- Optionally lists only Git-tracked files (--git-tracked-only) using 'git ls-files' instead of walking the directory.
+- Optionally (--cache) caches the table in the repository's .git directory and replays it while the Git status and index are unchanged.
 - Prints usage instructions if no directory argument is provided.
 """
 
+import argparse
+import hashlib
+import itertools
+import json
 import os
 import re
 import sys
 import subprocess
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 # Extended mapping of file extensions to Salesforce metadata types.
 # This dictionary maps common Salesforce file extensions to their corresponding metadata types.
@@ -80,121 +89,389 @@ SALESFORCE_METADATA_TYPES = {
     ".quickAction-meta.xml": "QuickAction",
 }
 
-def detect_file_state(file_path, base_dir):
+# Directories that never contain Salesforce metadata and are not descended into unless --include-hidden is given.
+_IGNORE_DIRS = frozenset({".git", ".sfdx", "node_modules", ".venv", "__pycache__", "dist", "build", ".cache"})
+
+# Name of the table cache file, stored in the Git directory of the scanned repository.
+CACHE_FILE_NAME = "sf-component-table.cache"
+
+# Header and separator rows of the generated Markdown table.
+TABLE_HEADER = "| State       | Name         | Type        | Path                     |"
+TABLE_SEPARATOR = "|-------------|--------------|-------------|--------------------------|"
+
+def find_git_dirs(base_dir):
+    """
+    Finds the root and the Git directory of the repository containing base_dir.
+    
+    How it works:
+    - Calls 'git rev-parse --show-toplevel --absolute-git-dir' once for the whole run.
+    - Returns a tuple (repository root, Git directory) of absolute paths.
+    - If base_dir is not inside a Git repository, or Git is not available, returns (None, None).
+    """
+    try:
+        git_dirs = subprocess.run(["git", "-C", base_dir, "rev-parse", "--show-toplevel", "--absolute-git-dir"],
+                                  capture_output=True, text=True, check=True).stdout.splitlines()
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+    if len(git_dirs) != 2:
+        return None, None  # e.g. base_dir is inside the .git directory itself
+
+    return git_dirs[0], git_dirs[1]
+
+def load_git_status(base_dir, git_root, all_untracked=False):
+    """
+    Collects the Git status of every changed file below base_dir in a single call.
+    
+    How it works:
+    - If git_root is None (base_dir is not in a Git repository), returns an empty dictionary without calling Git.
+    - Runs 'git status --porcelain -z' once against git_root instead of once per file,
+      limited to base_dir with a literal pathspec so Git only checks the scanned subtree.
+    - If all_untracked is set, adds -uall so each untracked file is listed rather than collapsing untracked
+      directories into one entry; only the cache fingerprint needs this, since untracked files are "Unmodified".
+    - Splits the NUL-separated output into entries; each entry is a two-letter status code and a path.
+    - Skips the extra source path that follows rename and copy entries.
+    - Translates paths relative to git_root into paths relative to base_dir using a prefix computed once.
+    - Returns a dictionary mapping paths relative to base_dir to their status code.
+    - If Git fails, it returns an empty dictionary.
+    """
+    status_map = {}
+    if git_root is None:
+        return status_map
+
+    prefix = os.path.relpath(os.path.realpath(base_dir), git_root).replace(os.sep, "/")
+    prefix = "" if prefix == "." else prefix + "/"
+    pathspec = [":(literal)" + prefix] if prefix else []
+
+    untracked = ["-uall"] if all_untracked else []
+
+    try:
+        git_status = subprocess.run(["git", "-C", git_root, "status", "--porcelain", "-z"] + untracked + ["--"] + pathspec,
+                                    capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return status_map  # If Git fails, assume "Unmodified"
+
+    entries = iter(git_status.stdout.split("\x00"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        status_code, path = entry[:2], entry[3:]
+        if status_code[0] in "RC":
+            next(entries, None)  # Renames and copies are followed by their original path
+        if path.startswith(prefix):
+            status_map[path[len(prefix):]] = status_code
+
+    return status_map
+
+# Lookup tables derived from SALESFORCE_METADATA_TYPES so a file can be classified with dictionary lookups.
+# Keys of _META_TYPES are the last two dotted segments of a "-meta.xml" file (e.g. "cls-meta.xml").
+# Keys of _SIMPLE_TYPES are plain extensions including the leading dot (e.g. ".cls"); _SIMPLE_EXTS holds
+# the same keys as a tuple so str.endswith can reject unknown extensions in a single call.
+_META_SUFFIX = "-meta.xml"
+_META_TYPES = {ext[1:]: sf_type for ext, sf_type in SALESFORCE_METADATA_TYPES.items() if ext.endswith(_META_SUFFIX)}
+_SIMPLE_TYPES = {ext: sf_type for ext, sf_type in SALESFORCE_METADATA_TYPES.items() if not ext.endswith(_META_SUFFIX)}
+_SIMPLE_EXTS = tuple(_SIMPLE_TYPES)
+
+def classify_file(file_name):
+    """
+    Determines the Salesforce metadata type of a file from its name.
+    
+    How it works:
+    - For "-meta.xml" files, looks up the last two dotted segments in the meta extension table.
+    - For files ending in a known plain extension, looks up the last dotted segment in the simple extension table.
+    - If a match is found, removes the extension from the name for clarity.
+    - Returns a tuple (stripped name, type); the type is empty if no extension matched.
+    """
+    if file_name.endswith(_META_SUFFIX):
+        ext = ".".join(file_name.rsplit(".", 2)[-2:])
+        metadata_type = _META_TYPES.get(ext)
+        if metadata_type is None or len(ext) >= len(file_name):
+            return file_name, ""
+        return file_name[:-len(ext) - 1], metadata_type
+
+    if file_name.endswith(_SIMPLE_EXTS):
+        ext = "." + file_name.rsplit(".", 1)[1]
+        return file_name[:-len(ext)], _SIMPLE_TYPES[ext]
+
+    return file_name, ""
+
+def detect_file_state(rel_path, status_map):
     """
     Determines whether the file is newly created, modified, or unchanged using Git.
     
     How it works:
-    - Calls 'git status --porcelain' on the file (using its relative path).
+    - Looks up the file (using its relative path) in the status map built by load_git_status.
     - If the status code starts with "A", returns "Created".
     - If the status code starts with "M", returns "Changed".
     - Otherwise, defaults to "Unmodified".
-    - If Git is not available or an error occurs, it returns "Unmodified".
     """
-    try:
-        rel_path = os.path.relpath(file_path, base_dir)
-        git_status = subprocess.run(["git", "status", "--porcelain", rel_path],
-                                    capture_output=True, text=True)
-        status_code = git_status.stdout.strip()[:2]  # Extract status code (e.g., "A ", "M ")
-
-        if status_code.startswith("A"):
-            return "Created"
-        elif status_code.startswith("M"):
-            return "Changed"
-    except Exception:
-        pass  # If Git isn't available or an error occurs, assume "Unmodified"
+    status_code = status_map.get(rel_path, "").lstrip()  # Unstaged changes start with a space
+
+    if status_code.startswith("A"):
+        return "Created"
+    elif status_code.startswith("M"):
+        return "Changed"
 
     return "Unmodified"
 
-def categorize_files(base_dir):
+def list_directory(dir_path, rel_prefix, ignore_dirs=_IGNORE_DIRS):
+    """
+    Lists a single directory.
+    
+    How it works:
+    - Uses os.scandir so the file type comes from the directory listing without extra stat calls.
+    - Does not descend into symbolic links to directories, and leaves out subdirectories named in ignore_dirs.
+    - Lists every other entry (including symbolic links to files) as a file, matching os.walk,
+      so the sequential and parallel walks report the same set of files.
+    - Returns a tuple (subdirectories, files): subdirectories as (path, relative prefix) pairs and
+      files as (relative path, file name) pairs.
+    - If the directory cannot be read (e.g. no permission, or it vanished), returns empty lists,
+      so the directory is skipped just like os.walk does.
+    """
+    subdirs = []
+    files = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.is_symlink() or entry.name in ignore_dirs:
+                        continue
+                    subdirs.append((entry.path, rel_prefix + entry.name + "/"))
+                else:
+                    files.append((rel_prefix + entry.name, entry.name))
+    except OSError:
+        return [], []
+    return subdirs, files
+
+def scan_files(dir_path, rel_prefix="", ignore_dirs=_IGNORE_DIRS):
+    """
+    Recursively yields every file below dir_path.
+    
+    How it works:
+    - Lists each directory with the list_directory function and recurses into its subdirectories.
+    - Yields a tuple (relative path, file name) for each file, so no os.path.relpath calls are needed.
+    """
+    subdirs, files = list_directory(dir_path, rel_prefix, ignore_dirs)
+    yield from files
+    for subdir_path, subdir_prefix in subdirs:
+        yield from scan_files(subdir_path, subdir_prefix, ignore_dirs)
+
+def scan_files_parallel(base_dir, jobs, ignore_dirs=_IGNORE_DIRS):
     """
-    Recursively scans the directory and categorizes files.
+    Yields every file below base_dir, listing directories concurrently.
     
     How it works:
-    - Uses os.walk to traverse all subdirectories.
-    - For each file, checks if its name ends with any known Salesforce metadata extension.
-    - If a match is found, assigns the corresponding type and removes the extension from the name.
-    - If no match is found, includes the file with an empty type.
-    - Determines the file state using the detect_file_state function.
-    - Collects a tuple (state, name, type, relative path) for each file.
-    """
-    file_data = []
-
-    for root, _, files in os.walk(base_dir):
-        for file in files:
-            file_path = os.path.join(root, file)
-
-            metadata_type = ""
-            stripped_name = file  # Default: use the full filename
-            matched_ext = None
-
-            for ext, sf_type in SALESFORCE_METADATA_TYPES.items():
-                if file.endswith(ext):
-                    metadata_type = sf_type
-                    matched_ext = ext
-                    break
-            
-            # If a known extension is found, remove it from the file name for clarity.
-            if matched_ext:
-                stripped_name = file[:-len(matched_ext)]
-            
-            state = detect_file_state(file_path, base_dir)
-            relative_path = os.path.relpath(file_path, base_dir)
-            file_data.append((state, stripped_name, metadata_type, relative_path))
-
-    return file_data
-
-def generate_markdown_table(file_data):
-    """
-    Generates a Markdown table from the file data.
+    - Submits the listing of base_dir to a thread pool with the given number of workers.
+    - Each completed listing submits a new task for every subdirectory it found.
+    - Files are yielded from the calling thread as listings complete, so no locking is needed.
+    - Unreadable directories and symbolic links are handled by list_directory exactly as in the sequential walk.
+    - Useful on network filesystems where directory listing latency dominates; the order of files is not stable.
+    """
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending = {executor.submit(list_directory, base_dir, "", ignore_dirs)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirs, files = future.result()
+                for subdir_path, subdir_prefix in subdirs:
+                    pending.add(executor.submit(list_directory, subdir_path, subdir_prefix, ignore_dirs))
+                yield from files
+
+def scan_git_files(base_dir, status_map):
+    """
+    Yields every file below base_dir that is tracked by Git.
     
     How it works:
-    - Creates the header row and a separator row.
-    - Iterates over each file entry and creates a table row with columns: State, Name, Type, and Path.
-    - Joins all rows into a single string representing the Markdown table.
+    - Runs 'git ls-files -z' once in base_dir; Git lists its index, so ignored directories are never visited.
+    - Git reports the paths relative to base_dir, so they are used as-is.
+    - Skips files deleted from the working tree but still in the index (a "D" in the worktree column
+      of the status map), so the result matches walking the directory.
+    - Yields a tuple (relative path, file name) for each tracked file.
     """
-    markdown_table = []
-    markdown_table.append("| State       | Name         | Type        | Path                     |")
-    markdown_table.append("|-------------|--------------|-------------|--------------------------|")
+    git_files = subprocess.run(["git", "-C", base_dir, "ls-files", "-z"],
+                               capture_output=True, text=True, check=True)
 
-    for row in file_data:
-        markdown_table.append(f"| {row[0]} | {row[1]} | {row[2]} | {row[3]} |")
+    for relative_path in git_files.stdout.split("\x00"):
+        if relative_path and status_map.get(relative_path, "  ")[1] != "D":
+            yield relative_path, relative_path.rsplit("/", 1)[-1]
 
-    return "\n".join(markdown_table)
+def iter_rows(base_dir, status_map, jobs=1, tracked_only=False, ignore_dirs=_IGNORE_DIRS):
+    """
+    Scans the directory and yields one Markdown table row per file.
+    
+    How it works:
+    - Uses the scan_git_files function if tracked_only is set, otherwise traverses all subdirectories
+      with the scan_files function, or scan_files_parallel if jobs > 1, skipping directories in ignore_dirs.
+    - For each file, determines its type and stripped name using the classify_file function.
+    - Files that do not match any known extension are included with an empty type.
+    - Determines the file state using the detect_file_state function and the pre-computed status map.
+    - Immediately yields the formatted row with columns: State, Name, Type, and Path,
+      so each file is visited once and nothing is collected in memory.
+    """
+    row_template = "| {} | {} | {} | {} |".format
+    if tracked_only:
+        files = scan_git_files(base_dir, status_map)
+    elif jobs > 1:
+        files = scan_files_parallel(base_dir, jobs, ignore_dirs)
+    else:
+        files = scan_files(base_dir, ignore_dirs=ignore_dirs)
+
+    for relative_path, file in files:
+        stripped_name, metadata_type = classify_file(file)
+        state = detect_file_state(relative_path, status_map)
+        yield row_template(state, stripped_name, metadata_type, relative_path)
 
-def print_usage():
+def get_mtime_ns(path):
     """
-    Prints the usage instructions for the script.
+    Returns the modification time of path in nanoseconds, or None if it cannot be read.
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def cache_fingerprint(base_dir, git_dir, options, status_map):
+    """
+    Describes the state a cached table was generated from.
     
     How it works:
-    - Informs the user how to run the script with the required directory argument.
+    - Records the scanned directory and the options that change the table's content or row order.
+    - Records the modification times of the Git index, of base_dir itself, and of this script.
+    - Records a digest of the Git status map, so edited, added, deleted, and untracked files (including new files
+      inside untracked directories) invalidate the cache even though editing a file does not touch the index.
+    - Changes limited to files Git ignores are not detected, which is why the cache is opt-in; use --refresh-cache.
     """
-    print("Usage: python generate-component-table.py <directory>")
-    print("Scans a Salesforce source directory and generates a Markdown table.")
+    status_digest = hashlib.sha1(json.dumps(sorted(status_map.items())).encode("utf-8")).hexdigest()
+
+    return {
+        "base_dir": os.path.realpath(base_dir),
+        "options": options,
+        "index_mtime_ns": get_mtime_ns(os.path.join(git_dir, "index")),
+        "walk_root_mtime_ns": get_mtime_ns(base_dir),
+        "script_mtime_ns": get_mtime_ns(os.path.abspath(__file__)),
+        "status_digest": status_digest,
+    }
 
-def main():
+def load_cache(cache_path, fingerprint):
     """
-    Main entry point for the script.
+    Returns the cached Markdown table if it was generated from the given fingerprint.
     
     How it works:
-    - Checks command-line arguments for a directory.
-    - If no valid directory is provided, prints usage instructions and exits.
-    - Otherwise, calls categorize_files to gather file data, generates the Markdown table, and prints it.
+    - Reads the JSON cache file and compares its recorded fingerprint with the current one.
+    - Returns None if the cache is missing, unreadable, or stale.
     """
-    if len(sys.argv) != 2:
-        print_usage()
-        sys.exit(1)
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+        table = cache.pop("table")
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+    return table if cache == fingerprint else None
+
+def save_cache(cache_path, fingerprint, table):
+    """
+    Writes the Markdown table and its fingerprint to the cache file.
+    
+    How it works:
+    - Writes to a temporary file first and moves it into place with os.replace, so readers never see a partial cache.
+    - Failing to write the cache is not an error; the table has already been printed.
+    """
+    temp_path = cache_path + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(dict(fingerprint, table=table), cache_file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
 
-    base_dir = sys.argv[1]
+def parse_args(argv=None):
+    """
+    Parses the command-line arguments for the script.
+    
+    How it works:
+    - Expects the directory to scan as the only positional argument.
+    - Accepts --jobs to list directories with a thread pool; defaults to 1 (a plain sequential walk).
+    - Accepts --git-tracked-only to list only files tracked by Git instead of walking the filesystem.
+    - Accepts --include-hidden to also descend into directories that are skipped by default (.git, node_modules, ...).
+    - Accepts --cache to replay and update a cached table, and --refresh-cache to regenerate it (implies --cache).
+    - Reads sys.argv unless an explicit argument list is given.
+    - Prints usage instructions and exits if the arguments are invalid.
+    """
+    parser = argparse.ArgumentParser(
+        prog="generate-component-table.py",
+        description="Scans a Salesforce source directory and generates a Markdown table.")
+    parser.add_argument("directory", help="Salesforce source directory to scan")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="number of threads used to list directories (useful on network filesystems)")
+    parser.add_argument("--git-tracked-only", action="store_true",
+                        help="only list files tracked by Git, using 'git ls-files' instead of walking the directory")
+    parser.add_argument("--include-hidden", action="store_true",
+                        help="also scan directories skipped by default: " + ", ".join(sorted(_IGNORE_DIRS)))
+    parser.add_argument("--cache", action="store_true",
+                        help="replay a cached table from the repository's .git directory while the Git status is unchanged, "
+                             "and update it otherwise (changes to Git-ignored files are not detected)")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help="ignore the cached table, regenerate it, and update the cache (implies --cache)")
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    return args
+
+def main(argv=None):
+    """
+    Main entry point for the script.
+    
+    How it works:
+    - Parses the command-line arguments (or argv, when called from other tooling) for a directory and options.
+    - If no valid directory is provided, prints an error and exits.
+    - Otherwise, finds the Git repository and loads the Git status once.
+    - With --cache, if a cached table matches the current state, prints it and stops without scanning the directory.
+    - Otherwise, prints the table header and streams the rows from iter_rows.
+    - With --cache or --refresh-cache, the printed table is cached in the Git directory if base_dir is in a Git repository.
+    - --git-tracked-only falls back to walking the directory if base_dir is not inside a Git repository.
+    """
+    args = parse_args(argv)
+    base_dir = args.directory
 
     if not os.path.isdir(base_dir):
         print(f"Error: Directory '{base_dir}' not found.")
         sys.exit(1)
 
-    file_data = categorize_files(base_dir)
-    markdown_table = generate_markdown_table(file_data)
+    git_root, git_dir = find_git_dirs(base_dir)
+    tracked_only = args.git_tracked_only and git_root is not None
+    ignore_dirs = frozenset() if args.include_hidden else _IGNORE_DIRS
+
+    use_cache = git_dir is not None and (args.cache or args.refresh_cache)
+    status_map = load_git_status(base_dir, git_root, all_untracked=use_cache)
+
+    cache_path = None
+    if use_cache:
+        cache_path = os.path.join(git_dir, CACHE_FILE_NAME)
+        # Taken after 'git status' ran, since it may have refreshed the index.
+        fingerprint = cache_fingerprint(base_dir, git_dir, [tracked_only, args.include_hidden, args.jobs], status_map)
+
+        if not args.refresh_cache:
+            table = load_cache(cache_path, fingerprint)
+            if table is not None:
+                sys.stdout.write(table)
+                return
+
+    rows = iter_rows(base_dir, status_map, args.jobs, tracked_only, ignore_dirs)
+    lines = (line + "\n" for line in itertools.chain((TABLE_HEADER, TABLE_SEPARATOR), rows))
+
+    if cache_path is None:
+        sys.stdout.writelines(lines)
+        return
+
+    table = []
+    for line in lines:
+        sys.stdout.write(line)
+        table.append(line)
 
-    print(markdown_table)
+    save_cache(cache_path, fingerprint, "".join(table))
 
 if __name__ == "__main__":
     main()